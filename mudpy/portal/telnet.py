@@ -78,6 +78,15 @@ class TelnetCode(IntEnum):
             return str(val)
 
 
+# Plain int copies of the hot-path codes, so comparisons skip IntEnum dispatch.
+_IAC, _SE, _SB, _WILL, _WONT, _DO, _DONT = 255, 240, 250, 251, 252, 253, 254
+
+# Wire bytes for every possible negotiation, so they never need building per message.
+_NEG_WIRE = {
+    (c, o): bytes((_IAC, c, o)) for c in (_WILL, _WONT, _DO, _DONT) for o in range(256)
+}
+
+
 class TelnetData:
     def __init__(self, data: bytes):
         self.data = data
@@ -113,7 +122,7 @@ class TelnetNegotiate:
         self.option = int(option)
 
     def __bytes__(self):
-        return bytes([TelnetCode.IAC.value, self.command, self.option])
+        return _NEG_WIRE[(self.command, self.option)]
 
     def __str__(self):
         out = [
@@ -128,28 +137,32 @@ class TelnetNegotiate:
 
 
 class TelnetSubNegotiate:
-    def __init__(self, option: int, data: bytes):
+    """
+    A subnegotiation message. For received messages, data is a memoryview into the
+    connection's read buffer and is only valid during the at_receive_subnegotiate
+    call. It is released afterwards, and str()/repr() will then raise ValueError,
+    so copy it with bytes() to keep it.
+    """
+
+    def __init__(self, option: int, data: typing.Union[bytes, bytearray, memoryview]):
         self.option = option
         self.data = data
+        # Built on first use; received subnegotiations are never serialized.
+        self._wire = None
 
     def __bytes__(self):
-        return bytes(
-            [
-                TelnetCode.IAC.value,
-                TelnetCode.SB.value,
-                self.option,
-                *self.data,
-                TelnetCode.IAC.value,
-                TelnetCode.SE.value,
-            ]
-        )
+        if self._wire is None:
+            self._wire = b"".join(
+                (bytes((_IAC, _SB, self.option)), self.data, bytes((_IAC, _SE)))
+            )
+        return self._wire
 
     def __str__(self):
         out = [
             TelnetCode.IAC.name,
             TelnetCode.SB.name,
             TelnetCode.to_str(self.option),
-            repr(self.data),
+            repr(bytes(self.data)),
             TelnetCode.IAC.name,
             TelnetCode.SE.name,
         ]
@@ -159,80 +172,91 @@ class TelnetSubNegotiate:
         return f"<TelnetSubNegotiate: {self}>"
 
 
-def scan_until_IAC(data: bytes) -> int:
-    for i in range(len(data)):
-        if data[i] == TelnetCode.IAC:  # 255 is the IAC byte
-            return i
-    return len(data)  # Return the length if IAC is not found
-
-
-def scan_until_IAC_SE(data: bytes) -> int:
-    i = 0
-    while i < len(data) - 1:  # -1 because we need at least 2 bytes for IAC SE
-        if data[i] == TelnetCode.IAC:
-            if data[i + 1] == TelnetCode.SE:
-                # Found unescaped IAC SE
-                return i + 2  # Return the length including IAC SE
-            elif data[i + 1] == TelnetCode.IAC:
-                # Escaped IAC, skip this and the next byte
-                i += 2
-                continue
-            # Else it's an IAC followed by something other than SE or another IAC,
-            # which is unexpected in subnegotiation. Handle as needed.
-        i += 1
-    return -1  # Return -1 to indicate that IAC SE was not found
+def scan_until_IAC(data: bytes, start: int = 0) -> int:
+    # bytes.find is a C-level memchr scan; far cheaper than looping in Python.
+    idx = data.find(b"\xff", start)
+    return len(data) if idx < 0 else idx  # Return the length if IAC is not found
+
+
+def scan_until_IAC_SE(data: bytes, start: int = 0) -> int:
+    # Bind the codes and bound method locally; these are the innermost comparisons.
+    IAC, SE = _IAC, _SE
+    find = data.find
+    last = len(data) - 1
+    pos = start
+    while True:
+        # Jump straight to the next IAC rather than stepping through every byte.
+        i = find(b"\xff", pos)
+        if i < 0 or i >= last:
+            # need at least 2 bytes for IAC SE
+            return -1  # Return -1 to indicate that IAC SE was not found
+        nxt = data[i + 1]
+        if nxt == SE:
+            # Found unescaped IAC SE
+            return i + 2  # Return the end offset including IAC SE
+        elif nxt == IAC:
+            # Escaped IAC, skip this and the next byte
+            pos = i + 2
+            continue
+        # Else it's an IAC followed by something other than SE or another IAC,
+        # which is unexpected in subnegotiation. Handle as needed.
+        pos = i + 1
 
 
 def parse_telnet(
     data: bytes,
+    start: int = 0,
 ) -> tuple[
     int,
     typing.Union[None, TelnetCommand, TelnetData, TelnetNegotiate, TelnetSubNegotiate],
 ]:
     """
     Parse a raw byte sequence and return a tuple consisting of bytes-to-advance by, and an optional Telnet message.
+
+    Parsing begins at the start offset, so callers can walk a buffer in place instead of slicing it.
     """
-    if len(data) < 1:
+    available = len(data) - start
+    if available < 1:
         return 0, None
 
-    if data[0] == TelnetCode.IAC:
-        if len(data) < 2:
+    if data[start] == _IAC:
+        if available < 2:
             # we need at least 2 bytes for an IAC to mean anything.
             return 0, None
 
-        if data[1] == TelnetCode.IAC:
+        b1 = data[start + 1]
+        if b1 == _IAC:
             # Escaped IAC
-            return 2, TelnetData(data[:1])
-        elif data[1] in (
-            TelnetCode.WILL,
-            TelnetCode.WONT,
-            TelnetCode.DO,
-            TelnetCode.DONT,
-        ):
-            if len(data) < 3:
+            return 2, TelnetData(data[start : start + 1])
+        elif _WILL <= b1 <= _DONT:
+            if available < 3:
                 return 0, None
-            return 3, TelnetNegotiate(data[1], data[2])
-        elif data[1] == TelnetCode.SB:
-            length = scan_until_IAC_SE(data)
-            if length < 5:
+            return 3, TelnetNegotiate(b1, data[start + 2])
+        elif b1 == _SB:
+            end = scan_until_IAC_SE(data, start)
+            length = end - start
+            if end < 0 or length < 5:
                 return 0, None
-            return length, TelnetSubNegotiate(data[2], data[3 : length - 2])
+            # Hand out a view of the payload rather than copying it.
+            return length, TelnetSubNegotiate(
+                data[start + 2], memoryview(data)[start + 3 : end - 2]
+            )
         else:
             # Other command
-            return 2, TelnetCommand(data[1])
+            return 2, TelnetCommand(b1)
 
     # If the first byte isn't an IAC, scan until the first IAC or end of data
-    length = scan_until_IAC(data)
-    return length, TelnetData(data[:length])
+    end = scan_until_IAC(data, start)
+    return end - start, TelnetData(data[start:end])
 
 
-@dataclass
+@dataclass(slots=True)
 class TelnetOptionState:
     enabled: bool = False
     negotiating: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class TelnetOptionPerspective:
     local: TelnetOptionState = field(default_factory=TelnetOptionState)
     remote: TelnetOptionState = field(default_factory=TelnetOptionState)
@@ -351,8 +375,8 @@ class NAWSOption(TelnetOption):
         if len(data) != 4:
             return
         new_size = {
-            "width": int.from_bytes(data[0:2], "big"),
-            "height": int.from_bytes(data[2:4], "big"),
+            "width": (data[0] << 8) | data[1],
+            "height": (data[2] << 8) | data[3],
         }
         await self.protocol.change_capabilities(new_size)
 
@@ -381,6 +405,24 @@ class MTTSOption(TelnetOption):
         (1, "ansi"),
     ]
 
+    # MTTS flags which map directly onto a boolean capability.
+    MTTS_FLAGS = {
+        "encryption": "encryption",
+        "mslp": "mslp",
+        "mnes": "mnes",
+        "proxy": "proxy",
+        "vt100": "vt100",
+        "screenreader": "screen_reader",
+        "osc_color_palette": "osc_color_palette",
+        "mouse_tracking": "mouse_tracking",
+    }
+
+    MTTS_COLOR = {
+        "truecolor": ColorType.TRUECOLOR,
+        "xterm256": ColorType.EIGHT_BIT,
+        "ansi": ColorType.STANDARD,
+    }
+
     def __init__(self, protocol):
         super().__init__(protocol)
         self.number_requests = 0
@@ -400,7 +442,7 @@ class MTTSOption(TelnetOption):
             return
         if data[0] != 0:
             return
-        payload = data[1:].decode()
+        payload = bytes(data[1:]).decode()
 
         if payload == self.last_received:
             self.negotiation.set()
@@ -498,34 +540,18 @@ class MTTSOption(TelnetOption):
         except ValueError as err:
             return
 
-        supported = {
-            capability for bitval, capability in self.MTTS if number & bitval > 0
-        }
-
         out = dict()
         max_color = self.protocol.capabilities.color
 
-        for c in supported:
-            match c:
-                case (
-                    "encryption"
-                    | "mslp"
-                    | "mnes"
-                    | "proxy"
-                    | "vt100"
-                    | "screenreader"
-                    | "osc_color_palette"
-                    | "mouse_tracking"
-                ):
-                    out[c] = True
-                case "truecolor":
-                    max_color = max(ColorType.TRUECOLOR, max_color)
-                case "xterm256":
-                    max_color = max(ColorType.EIGHT_BIT, max_color)
-                case "ansi":
-                    max_color = max(ColorType.STANDARD, max_color)
-                case "utf8":
-                    out["encoding"] = "utf-8"
+        for bitval, c in self.MTTS:
+            if not number & bitval:
+                continue
+            if attr := self.MTTS_FLAGS.get(c, None):
+                out[attr] = True
+            elif color := self.MTTS_COLOR.get(c, None):
+                max_color = max(color, max_color)
+            elif c == "utf8":
+                out["encoding"] = "utf-8"
 
         if max_color != self.protocol.capabilities.color:
             out["color"] = max_color
@@ -582,11 +608,14 @@ class MCCP3Option(TelnetOption):
             await self.protocol.change_capabilities({"mccp3_enabled": True})
             self.protocol._tn_decompress_in = zlib.decompressobj()
             try:
+                # Everything after the read cursor arrived compressed.
+                pos = self.protocol._tn_read_pos
                 self.protocol._tn_read_buffer = bytearray(
                     self.protocol._tn_decompress_in.decompress(
-                        self.protocol._tn_read_buffer
+                        memoryview(self.protocol._tn_read_buffer)[pos:]
                     )
                 )
+                self.protocol._tn_read_pos = 0
             except zlib.error as e:
                 pass  # todo: handle this
 
@@ -613,11 +642,11 @@ class GMCPOption(TelnetOption):
     start_local: bool = True
 
     async def send_gmcp(self, command: str, data: "Any" = None):
-        to_send = bytearray()
-        to_send.extend(command.encode())
+        to_send = bytearray(command.encode())
         if data is not None:
-            gmcp_data = f" {orjson.dumps(data)}"
-            to_send.extend(gmcp_data.encode())
+            # orjson already produces UTF-8 bytes; append them directly.
+            to_send.append(0x20)
+            to_send.extend(orjson.dumps(data))
         await self.send_subnegotiate(to_send)
 
 
@@ -631,43 +660,20 @@ class EOROption(TelnetOption):
     code = TelnetCode.TELOPT_EOR
 
 
-def ensure_crlf(input_str: str) -> str:
+def ensure_crlf(input_str: str) -> bytes:
     """
-    Ensure that every newline in the input string is preceded by a carriage return.
-    Also, escape any Telnet IAC (255) characters by duplicating them.
+    Encode the input string and ensure that every newline is preceded by a carriage return.
+    UTF-8 output never contains the Telnet IAC (255) byte, so no escaping is needed.
 
     Args:
         input_str: The input string.
 
     Returns:
-        A new string with CRLF line endings and escaped IAC characters.
+        UTF-8 bytes with CRLF line endings.
     """
-    result = []  # We'll build the output as a list of characters
-    prev_char_is_cr = False
-    iac = chr(255)
-
-    for c in input_str:
-        if c == "\r":
-            # Only add a CR if the previous character wasn't a CR.
-            if not prev_char_is_cr:
-                result.append("\r")
-            prev_char_is_cr = True
-        elif c == "\n":
-            # If the previous char wasn't a CR, add one before the newline.
-            if not prev_char_is_cr:
-                result.append("\r")
-            result.append("\n")
-            prev_char_is_cr = False
-        elif c == iac:
-            # Telnet IAC character: escape it by adding it twice.
-            result.append(c)
-            result.append(c)
-            prev_char_is_cr = False
-        else:
-            result.append(c)
-            prev_char_is_cr = False
-
-    return "".join(result)
+    # Working on the encoded bytes lets each pass run as a C-level replace.
+    data = input_str.encode("utf-8")
+    return data.replace(b"\r\n", b"\n").replace(b"\n", b"\r\n")
 
 
 class TelnetConnection(BaseConnection):
@@ -695,6 +701,8 @@ class TelnetConnection(BaseConnection):
         self._tn_writer = writer
         self._tn_server = server
         self._tn_read_buffer = bytearray()
+        # Offset of the first unparsed byte in _tn_read_buffer.
+        self._tn_read_pos = 0
         self._tn_in_queue = asyncio.Queue()
         self._tn_out_queue = asyncio.Queue()
         self._tn_app_data = bytearray()
@@ -739,20 +747,73 @@ class TelnetConnection(BaseConnection):
                 if self._tn_decompress_in.unused_data != b"":
                     op: MCCP3Option = self._tn_options[TelnetCode.MCCP3]
                     await op.at_decompress_end()
-                self._tn_read_buffer.extend(data)
             except zlib.error as e:
                 op: MCCP3Option = self._tn_options[TelnetCode.MCCP3]
                 await op.at_decompress_end()
-        else:
-            self._tn_read_buffer.extend(data)
+                data = b""
 
-        while True:
-            length, message = parse_telnet(self._tn_read_buffer)
-            if message is not None:
-                del self._tn_read_buffer[:length]
-                await self._tn_at_telnet_message(message)
+        IAC = _IAC
+        try:
+            if self._tn_read_pos == len(self._tn_read_buffer):
+                first_iac = data.find(b"\xff")
+                if first_iac == -1:
+                    # Nothing carried over and no IAC, so the whole chunk is app data.
+                    if data:
+                        await self._tn_handle_data(TelnetData(data))
+                    return
+                # Nothing is carried over, so parse the chunk in place rather than
+                # copying it into the read buffer first.
+                self._tn_read_buffer = data
+                self._tn_read_pos = first_iac
+                if first_iac:
+                    # Any leading app data ends at the IAC just found; no need to rescan.
+                    await self._tn_handle_data(TelnetData(data[:first_iac]))
             else:
-                break
+                self._tn_read_buffer.extend(data)
+
+            while True:
+                # Handlers may swap the buffer out (MCCP3), so re-fetch it each pass.
+                buf = self._tn_read_buffer
+                pos = self._tn_read_pos
+                if pos >= len(buf):
+                    break
+
+                if buf[pos] != IAC:
+                    # Plain app data runs up to the next IAC; take it in one scan.
+                    end = scan_until_IAC(buf, pos)
+                    self._tn_read_pos = end
+                    await self._tn_handle_data(TelnetData(buf[pos:end]))
+                    continue
+
+                length, message = parse_telnet(buf, pos)
+                if message is not None:
+                    self._tn_read_pos += length
+                    await self._tn_at_telnet_message(message)
+                else:
+                    break
+        finally:
+            # This must run even if a handler raised, or an in-place bytes buffer
+            # would be left behind for the next chunk to extend.
+            self._tn_compact_read_buffer()
+
+    def _tn_compact_read_buffer(self):
+        """
+        Advance a cursor per message and only compact the buffer occasionally,
+        rather than shifting the whole remainder down after every message.
+        """
+        remaining = len(self._tn_read_buffer) - self._tn_read_pos
+        if not isinstance(self._tn_read_buffer, bytearray):
+            # Parsed in place from the incoming chunk; keep only the unparsed tail.
+            self._tn_read_buffer = bytearray(
+                memoryview(self._tn_read_buffer)[self._tn_read_pos :]
+            )
+            self._tn_read_pos = 0
+        elif not remaining:
+            self._tn_read_buffer.clear()
+            self._tn_read_pos = 0
+        elif self._tn_read_pos > 4096 and remaining < 1024:
+            del self._tn_read_buffer[: self._tn_read_pos]
+            self._tn_read_pos = 0
 
     async def _tn_at_telnet_message(self, message):
         """
@@ -772,25 +833,26 @@ class TelnetConnection(BaseConnection):
         self._tn_app_data.extend(message.data)
 
         # scan self._app_data for lines ending in \r\n...
+        buf = self._tn_app_data
+        pos = 0
         while True:
             # Find the position of the next newline character
-            newline_pos = self._tn_app_data.find(b"\n")
+            newline_pos = buf.find(b"\n", pos)
             if newline_pos == -1:
                 break  # No more newlines
 
             # Extract the line, trimming \r\n at the end
-            line = (
-                self._tn_app_data[:newline_pos]
-                .rstrip(b"\r\n")
-                .decode("utf-8", errors="ignore")
-            )
+            line = buf[pos:newline_pos].rstrip(b"\r\n").decode("utf-8", errors="ignore")
 
             # Process the line
             if line != "IDLE":
                 await self.user_input_queue.put(ClientCommand(text=line))
 
-            # Remove the processed line from _app_data
-            self._tn_app_data = self._tn_app_data[newline_pos + 1 :]
+            pos = newline_pos + 1
+
+        # Remove all processed lines from _app_data in one go
+        if pos:
+            del buf[:pos]
 
     async def _tn_handle_negotiate(self, message: TelnetNegotiate):
         if op := self._tn_options.get(message.option, None):
@@ -807,32 +869,53 @@ class TelnetConnection(BaseConnection):
                 await self._tn_out_queue.put(msg)
 
     async def _tn_handle_subnegotiate(self, message: TelnetSubNegotiate):
-        if op := self._tn_options.get(message.option, None):
-            await op.at_receive_subnegotiate(message)
+        try:
+            if op := self._tn_options.get(message.option, None):
+                await op.at_receive_subnegotiate(message)
+        finally:
+            # The payload is a view into _tn_read_buffer, which cannot be resized
+            # while it is held. Handlers must copy anything they want to keep.
+            if isinstance(message.data, memoryview):
+                message.data.release()
 
     async def _tn_handle_command(self, message: TelnetCommand):
         pass
 
     def _tn_encode_outgoing_data(self, msg) -> bytes:
         if self.capabilities.mccp2_enabled:
-            return self._tn_compress_out.compress(
-                bytes(msg)
-            ) + self._tn_compress_out.flush(zlib.Z_SYNC_FLUSH)
+            # The sync flush is issued once per write by _tn_run_writer.
+            return self._tn_compress_out.compress(bytes(msg))
         else:
             return bytes(msg)
 
+    async def _tn_prepare_outgoing(self, data) -> bytes:
+        """
+        Encodes a single outgoing message and fires its at_send hooks.
+
+        The hooks run before the next message is encoded, since they may change
+        how it must be encoded (e.g. MCCP2 starting compression).
+        """
+        encoded = self._tn_encode_outgoing_data(data)
+        match data:
+            case TelnetNegotiate():
+                if op := self._tn_options.get(data.option, None):
+                    await op.at_send_negotiate(data)
+            case TelnetSubNegotiate():
+                if op := self._tn_options.get(data.option, None):
+                    await op.at_send_subnegotiate(data)
+        return encoded
+
     async def _tn_run_writer(self):
         try:
             while data := await self._tn_out_queue.get():
-                encoded = self._tn_encode_outgoing_data(data)
-                self._tn_writer.write(encoded)
-                match data:
-                    case TelnetNegotiate():
-                        if op := self._tn_options.get(data.option, None):
-                            await op.at_send_negotiate(data)
-                    case TelnetSubNegotiate():
-                        if op := self._tn_options.get(data.option, None):
-                            await op.at_send_subnegotiate(data)
+                chunks = [await self._tn_prepare_outgoing(data)]
+                # Coalesce anything else already queued into a single write and drain.
+                while not self._tn_out_queue.empty():
+                    data = self._tn_out_queue.get_nowait()
+                    chunks.append(await self._tn_prepare_outgoing(data))
+                if self.capabilities.mccp2_enabled:
+                    chunks.append(self._tn_compress_out.flush(zlib.Z_SYNC_FLUSH))
+                self._tn_writer.write(b"".join(chunks))
                 await self._tn_writer.drain()
         except asyncio.CancelledError:
             # Optionally, perform any cleanup before re-raising.
@@ -867,8 +950,7 @@ class TelnetConnection(BaseConnection):
             return
 
     async def send_text(self, text: str):
-        converted = ensure_crlf(text)
-        await self._tn_out_queue.put(converted.encode())
+        await self._tn_out_queue.put(ensure_crlf(text))
 
     async def send_gmcp(self, command: str, data=None):
         if self.capabilities.gmcp:
@@ -0,0 +1,96 @@
+import types
+import unittest
+
+from rich.color import ColorType
+
+import mudpy
+
+mudpy.SETTINGS.setdefault("PORTAL", {"networking": {"game_url": "http://localhost"}})
+
+from mudpy.portal.telnet import (
+    TelnetCode,
+    TelnetConnection,
+    TelnetOption,
+    ensure_crlf,
+)
+
+
+class FailingOption(TelnetOption):
+    code = 99
+
+    async def at_receive_subnegotiate(self, msg):
+        raise RuntimeError("handler failed")
+
+
+class TestEnsureCRLF(unittest.TestCase):
+    def test_bare_newline_gets_cr(self):
+        self.assertEqual(ensure_crlf("a\nb"), b"a\r\nb")
+
+    def test_crlf_is_kept(self):
+        self.assertEqual(ensure_crlf("a\r\nb"), b"a\r\nb")
+
+    def test_lone_cr_is_kept(self):
+        self.assertEqual(ensure_crlf("a\rb"), b"a\rb")
+
+    def test_repeated_cr_is_not_collapsed(self):
+        self.assertEqual(ensure_crlf("\r\r\n"), b"\r\r\n")
+
+    def test_non_ascii_is_utf8_encoded_once(self):
+        self.assertEqual(ensure_crlf("\u00ff"), b"\xc3\xbf")
+
+
+class TestTelnetReceive(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.conn = TelnetConnection(None, None, types.SimpleNamespace(tls=False))
+
+    def received_lines(self) -> list[str]:
+        out = list()
+        while not self.conn.user_input_queue.empty():
+            out.append(self.conn.user_input_queue.get_nowait().text)
+        return out
+
+    async def test_handler_error_keeps_connection_readable(self):
+        self.conn._tn_options[FailingOption.code] = FailingOption(self.conn)
+        with self.assertRaises(RuntimeError):
+            await self.conn._tn_at_receive_raw_data(b"\xff\xfa\x63x\xff\xf0look\r\n")
+        self.assertIsInstance(self.conn._tn_read_buffer, bytearray)
+
+        await self.conn._tn_at_receive_raw_data(b"say hi\r\n")
+        self.assertEqual(self.received_lines(), ["look", "say hi"])
+
+    async def test_data_around_iac_split_across_chunks(self):
+        await self.conn._tn_at_receive_raw_data(b"look\r\n\xff")
+        await self.conn._tn_at_receive_raw_data(b"\xf1say ")
+        await self.conn._tn_at_receive_raw_data(b"hi\r\n")
+        self.assertEqual(self.received_lines(), ["look", "say hi"])
+        self.assertEqual(len(self.conn._tn_read_buffer), 0)
+
+
+class TestMTTS(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.conn = TelnetConnection(None, None, types.SimpleNamespace(tls=False))
+        self.op = self.conn._tn_options[TelnetCode.MTTS]
+
+    async def test_screenreader_sets_screen_reader(self):
+        await self.op.handle_standard("MTTS 64")
+        self.assertTrue(self.conn.capabilities.screen_reader)
+
+    async def test_highest_color_bit_wins(self):
+        # truecolor (256) + xterm256 (8) + ansi (1)
+        await self.op.handle_standard("MTTS 265")
+        self.assertEqual(self.conn.capabilities.color, ColorType.TRUECOLOR)
+
+
+class TestTelnetSend(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.conn = TelnetConnection(None, None, types.SimpleNamespace(tls=False))
+
+    async def test_gmcp_sends_json(self):
+        op = self.conn._tn_options[TelnetCode.GMCP]
+        await op.send_gmcp("X", {"a": 1})
+        msg = self.conn._tn_out_queue.get_nowait()
+        self.assertEqual(bytes(msg), b'\xff\xfa\xc9X {"a":1}\xff\xf0')
+
+
+if __name__ == "__main__":
+    unittest.main()